@@ -8,11 +8,20 @@ Last update: 2025-02-19 13:11
 """
 
 from sparse_matrix import SparseMatrix
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict, BinaryIO
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import atexit
+import glob
 import os
 import sys
 from datetime import datetime
 
+try:
+    import readline  # Tab completion + history for paths (not on Windows)
+except ImportError:
+    readline = None
+
 # my sample matrix files! 📁
 SAMPLE_FILES = [
     "../../sample_inputs/matrix1.txt",
@@ -26,42 +35,162 @@ SAMPLE_FILES = [
 # Where I save my results 💾
 RESULTS_DIR = "../../results"
 
+# Paths typed at earlier prompts, remembered between runs 📜
+HISTORY_FILE = os.path.expanduser("~/.sparse_matrix_history")
+HISTORY_LENGTH = 200
+
+# Results with more elements than this are saved in the compact binary format 📦
+BINARY_RESULT_THRESHOLD = 100_000
+BINARY_SUFFIX = ".bin"
+
+# Recently loaded matrices, keyed by (absolute path, modification time) 🧠
+# so picking the same file again skips re-parsing it
+MATRIX_CACHE_SIZE = 8
+_matrix_cache: "OrderedDict[Tuple[str, int], SparseMatrix]" = OrderedDict()
+
+# The main menu, built once and written in one go 🎯
+MENU = (
+    "\n" + "=" * 40 + "\n"
+    "🔢 Sparse Matrix Calculator 🔢\n"
+    + "=" * 40 + "\n"
+    "1. ➕ Add matrices\n"
+    "2. ➖ Subtract matrices\n"
+    "3. ✖️  Multiply matrices\n"
+    "4. 📊 Display matrix statistics\n"
+    "5. 👋 Exit\n"
+    "6. 🔁 Run all operations on one pair\n"
+    "7. ⚡ Run all operations in parallel\n"
+    + "=" * 40 + "\n"
+    "Enter your choice: "
+)
+
+# The statistics report, filled in from get_statistics() 📊
+STATS_TEMPLATE = (
+    "\n📊 Matrix Statistics:\n"
+    "📏 Size: {rows} x {cols}\n"
+    "🔢 Non-zero elements: {non_zero_elements}\n"
+    "💯 Total elements: {total_elements}\n"
+    "📈 Density: {density:.4%}\n"
+)
+STATS_RANGE_TEMPLATE = (
+    "⬇️  Minimum value: {min_value}\n"
+    "⬆️  Maximum value: {max_value}\n"
+)
+
+def same_size(matrix1: SparseMatrix, matrix2: SparseMatrix) -> bool:
+    """Can these two be added or subtracted? 📐"""
+    return matrix1.rows == matrix2.rows and matrix1.cols == matrix2.cols
+
+def can_multiply(matrix1: SparseMatrix, matrix2: SparseMatrix) -> bool:
+    """Can these two be multiplied? 📐"""
+    return matrix1.cols == matrix2.rows
+
+# Each operation: (SparseMatrix method, size check, headline and rule shown
+# when sizes are wrong) 🗂️
+OPERATIONS = {
+    "addition": ("add", same_size,
+                 "Can't add these matrices - sizes don't match!",
+                 "They need to be the same size for addition."),
+    "subtraction": ("subtract", same_size,
+                    "Can't subtract these matrices - sizes don't match!",
+                    "They need to be the same size for subtraction."),
+    "multiplication": ("multiply", can_multiply,
+                       "Can't multiply these matrices - sizes don't work!",
+                       "The columns of Matrix 1 must match the rows of Matrix 2."),
+}
+
 def ensure_results_directory():
     """Create results directory if it doesn't exist. 📁✨"""
     if not os.path.exists(RESULTS_DIR):
         os.makedirs(RESULTS_DIR)
         print(f"\nCreated results directory at {RESULTS_DIR}")
 
+_path_matches: List[str] = []
+
+def complete_path(text: str, state: int) -> Optional[str]:
+    """
+    Suggest file paths when the user presses Tab. ⌨️
+    
+    Args:
+        text (str): What the user has typed so far
+        state (int): Which suggestion readline is asking for (0, 1, 2, ...)
+        
+    Returns:
+        Optional[str]: The suggestion (or None when there are no more)
+    """
+    if state == 0:
+        # Only search the disk once per Tab press
+        _path_matches[:] = [
+            path + os.sep if os.path.isdir(path) else path
+            for path in sorted(glob.glob(os.path.expanduser(text) + "*"))
+        ]
+    return _path_matches[state] if state < len(_path_matches) else None
+
+def save_history() -> None:
+    """Remember typed paths for next time. 📜"""
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # History is a nice-to-have, never worth crashing over
+
+def setup_path_completion() -> None:
+    """Turn on Tab completion and history for file paths, if readline is around. ⌨️"""
+    if readline is None:
+        return
+        
+    readline.set_completer(complete_path)
+    readline.set_completer_delims(" \t\n")
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")  # macOS ships libedit
+    else:
+        readline.parse_and_bind("tab: complete")
+        
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass  # No history yet
+    atexit.register(save_history)
+
 def print_menu() -> None:
     """Show what we can do! 🎯"""
-    print("\n" + "=" * 40)
-    print("🔢 Sparse Matrix Calculator 🔢")
-    print("=" * 40)
-    print("1. ➕ Add matrices")
-    print("2. ➖ Subtract matrices")
-    print("3. ✖️  Multiply matrices")
-    print("4. 📊 Display matrix statistics")
-    print("5. 👋 Exit")
-    print("=" * 40)
-    print("Enter your choice: ", end="")
+    sys.stdout.write(MENU)
+
+# Which sample files exist and the list we show - checked once at startup,
+# and again only if opening a sample surprises us 🔄
+_sample_available: List[bool] = []
+_file_menu = ""
+
+def refresh_sample_files() -> None:
+    """Check which sample files exist and rebuild the file list. 🔄"""
+    global _file_menu
+    _sample_available[:] = [os.path.isfile(file_path) for file_path in SAMPLE_FILES]
+    
+    lines = ["\n📂 Available sample files:\n"]
+    for i, (file_path, available) in enumerate(zip(SAMPLE_FILES, _sample_available), 1):
+        status = "✅" if available else "❌"
+        lines.append(f"{i}. {status} {file_path}\n")
+    lines.append(f"\n💡 Tip: Enter 1-{len(SAMPLE_FILES)} for sample files or type a full path\n")
+    _file_menu = "".join(lines)
+
+refresh_sample_files()
 
 def list_sample_files() -> None:
     """Show available matrix files. 📂"""
-    print("\n📂 Available sample files:")
-    for i, file_path in enumerate(SAMPLE_FILES, 1):
-        status = "✅" if os.path.exists(file_path) else "❌"
-        print(f"{i}. {status} {file_path}")
-    print("\n💡 Tip: Enter 1-6 for sample files or type a full path")
+    sys.stdout.write(_file_menu)
 
-def get_file_choice(prompt: str) -> str:
+def get_file_choice(prompt: str) -> BinaryIO:
     """
     Get file choice from user - made super friendly! 😊
     
+    The file is opened right here, so checking that it exists and reading it
+    later is one open() instead of a stat() followed by an open().
+    
     Args:
         prompt (str): What to ask the user
         
     Returns:
-        str: The chosen file path
+        BinaryIO: The chosen file, opened for reading (the caller closes it)
     """
     while True:
         list_sample_files()
@@ -69,17 +198,49 @@ def get_file_choice(prompt: str) -> str:
         choice = input("Your choice: ").strip()
         
         # Check if user picked a sample file
+        sample = None
         if choice.isdigit() and 1 <= int(choice) <= len(SAMPLE_FILES):
-            file_path = SAMPLE_FILES[int(choice) - 1]
+            sample = int(choice) - 1
+            file_path = SAMPLE_FILES[sample]
         else:
             file_path = choice
             
-        if os.path.isfile(file_path):
-            return file_path
+        try:
+            file = open(file_path, 'rb')
+        except OSError:
+            file = None  # Missing, a directory, or unreadable - ask again
+            
+        if sample is not None and (file is not None) != _sample_available[sample]:
+            refresh_sample_files()  # A sample appeared or vanished since we last looked
+            
+        if file is not None:
+            return file
             
         print(f"\n❌ Oops! File '{file_path}' not found.")
         print("Please try again with a valid file number or path.")
 
+def load_matrix_cached(file: BinaryIO) -> SparseMatrix:
+    """
+    Load a matrix file, reusing the parsed matrix if the file hasn't changed. ♻️
+    
+    Args:
+        file (BinaryIO): The matrix file, opened for reading
+        
+    Returns:
+        SparseMatrix: The loaded matrix
+    """
+    key = (os.path.abspath(file.name), os.fstat(file.fileno()).st_mtime_ns)
+    matrix = _matrix_cache.get(key)
+    if matrix is not None:
+        _matrix_cache.move_to_end(key)
+        return matrix
+        
+    matrix = SparseMatrix(file)  # Text or binary - it checks the file's header 🔍
+    _matrix_cache[key] = matrix
+    if len(_matrix_cache) > MATRIX_CACHE_SIZE:
+        _matrix_cache.popitem(last=False)
+    return matrix
+
 def load_matrix(prompt: str) -> Optional[SparseMatrix]:
     """
     Load a matrix - with helpful error messages! 🎯
@@ -91,8 +252,8 @@ def load_matrix(prompt: str) -> Optional[SparseMatrix]:
         Optional[SparseMatrix]: The loaded matrix (or None if something went wrong)
     """
     try:
-        file_path = get_file_choice(prompt)
-        matrix = SparseMatrix(file_path)
+        with get_file_choice(prompt) as file:
+            matrix = load_matrix_cached(file)
         print(f"\n✅ Successfully loaded: {matrix}")
         return matrix
         
@@ -112,6 +273,41 @@ def load_matrix(prompt: str) -> Optional[SparseMatrix]:
         print(f"\n💥 Unexpected error: {str(e)}")
         return None
 
+def write_result(matrix: SparseMatrix, operation: str) -> str:
+    """
+    Write a result to a timestamped file in the results folder. 💾
+    
+    Args:
+        matrix (SparseMatrix): Matrix to save
+        operation (str): What we did (addition/subtraction/multiplication)
+        
+    Returns:
+        str: Name of the file written
+        
+    Raises:
+        IOError: If the file cannot be written
+    """
+    # Making sure i have a results directory
+    ensure_results_directory()
+    
+    # Create a filename with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    name = f"result_{operation}_{timestamp}"
+    
+    # Big results go in binary - writing and re-reading text would dominate
+    if matrix.nnz > BINARY_RESULT_THRESHOLD:
+        filename = name + BINARY_SUFFIX
+        try:
+            matrix.save_binary(os.path.join(RESULTS_DIR, filename))
+            return filename
+        except ValueError:
+            pass  # Values too big for the binary format - fall back to text
+    
+    # Save the file
+    filename = name + ".txt"
+    matrix.save_to_file(os.path.join(RESULTS_DIR, filename))
+    return filename
+
 def save_result(matrix: SparseMatrix, operation: str) -> bool:
     """
     Save our result - now in a nice results folder! 📁
@@ -124,16 +320,7 @@ def save_result(matrix: SparseMatrix, operation: str) -> bool:
         bool: True if save worked, False if something went wrong
     """
     try:
-        # Making sure i have a results directory
-        ensure_results_directory()
-        
-        # Create a filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"result_{operation}_{timestamp}.txt"
-        output_path = os.path.join(RESULTS_DIR, filename)
-        
-        # Save the file
-        matrix.save_to_file(output_path)
+        filename = write_result(matrix, operation)
         print(f"\n💾 Result saved to: {filename}")
         
         # Show some stats
@@ -151,27 +338,23 @@ def save_result(matrix: SparseMatrix, operation: str) -> bool:
 
 def display_matrix_statistics(matrix: SparseMatrix) -> None:
     """Show interesting facts about our matrix! 📊"""
-    stats = matrix.get_statistics()
-    print("\n📊 Matrix Statistics:")
-    print(f"📏 Size: {stats['dimensions'][0]} x {stats['dimensions'][1]}")
-    print(f"🔢 Non-zero elements: {stats['non_zero_elements']}")
-    print(f"💯 Total elements: {stats['total_elements']}")
-    print(f"📈 Density: {stats['density']:.4%}")
+    print_statistics(matrix.get_statistics())
+
+def print_statistics(stats: dict) -> None:
+    """Show statistics we already have (from get_statistics). 📊"""
+    rows, cols = stats['dimensions']
+    report = STATS_TEMPLATE.format(rows=rows, cols=cols, **stats)
     if stats['min_value'] is not None:
-        print(f"⬇️  Minimum value: {stats['min_value']}")
-        print(f"⬆️  Maximum value: {stats['max_value']}")
+        report += STATS_RANGE_TEMPLATE.format(**stats)
+    sys.stdout.write(report)
 
-def perform_operation(operation: str) -> Optional[SparseMatrix]:
+def load_matrix_pair() -> Optional[Tuple[SparseMatrix, SparseMatrix]]:
     """
-    Do the matrix math! ✨
+    Load the two matrices for an operation. 🔍
     
-    Args:
-        operation (str): What we're doing (add/subtract/multiply)
-        
     Returns:
-        Optional[SparseMatrix]: The result (or None if something went wrong)
+        Optional[Tuple[SparseMatrix, SparseMatrix]]: Both matrices (or None if either failed)
     """
-    # Loading my  matrices
     print("\n🔍 Loading first matrix:")
     matrix1 = load_matrix("Pick the first matrix:")
     if matrix1 is None:
@@ -182,39 +365,65 @@ def perform_operation(operation: str) -> Optional[SparseMatrix]:
     if matrix2 is None:
         return None
         
-    try:
-        # Show what i'm working with
-        print(f"\n🎯 Operation: {operation}")
-        print(f"📌 Matrix 1: {matrix1}")
-        print(f"📌 Matrix 2: {matrix2}")
+    return matrix1, matrix2
+
+def sizes_fit(operation: str, matrix1: SparseMatrix, matrix2: SparseMatrix) -> bool:
+    """
+    Check the sizes work for an operation, explaining why if they don't. 📐
+    
+    Args:
+        operation (str): What we're doing (addition/subtraction/multiplication)
+        matrix1 (SparseMatrix): Left-hand matrix
+        matrix2 (SparseMatrix): Right-hand matrix
         
-        #Now doing the math!
-        if operation == "addition":
-            if matrix1.rows != matrix2.rows or matrix1.cols != matrix2.cols:
-                print(f"\n❌ Can't add these matrices - sizes don't match!")
-                print(f"Matrix 1 is {matrix1.rows}x{matrix1.cols}")
-                print(f"Matrix 2 is {matrix2.rows}x{matrix2.cols}")
-                print("They need to be the same size for addition.")
-                return None
-            return matrix1.add(matrix2)
-            
-        elif operation == "subtraction":
-            if matrix1.rows != matrix2.rows or matrix1.cols != matrix2.cols:
-                print(f"\n❌ Can't subtract these matrices - sizes don't match!")
-                print(f"Matrix 1 is {matrix1.rows}x{matrix1.cols}")
-                print(f"Matrix 2 is {matrix2.rows}x{matrix2.cols}")
-                print("They need to be the same size for subtraction.")
-                return None
-            return matrix1.subtract(matrix2)
-            
-        elif operation == "multiplication":
-            if matrix1.cols != matrix2.rows:
-                print(f"\n❌ Can't multiply these matrices - sizes don't work!")
-                print(f"Matrix 1 is {matrix1.rows}x{matrix1.cols}")
-                print(f"Matrix 2 is {matrix2.rows}x{matrix2.cols}")
-                print("The columns of Matrix 1 must match the rows of Matrix 2.")
-                return None
-            return matrix1.multiply(matrix2)
+    Returns:
+        bool: True if the operation can be done
+    """
+    _, sizes_ok, size_headline, size_rule = OPERATIONS[operation]
+    if sizes_ok(matrix1, matrix2):
+        return True
+        
+    print(f"\n❌ {size_headline}")
+    print(f"Matrix 1 is {matrix1.rows}x{matrix1.cols}")
+    print(f"Matrix 2 is {matrix2.rows}x{matrix2.cols}")
+    print(size_rule)
+    return False
+
+def compute_operation(operation: str, matrix1: SparseMatrix,
+                      matrix2: SparseMatrix) -> SparseMatrix:
+    """
+    Just the math for one operation - no checks, no printing. 🧮
+    
+    Kept at module level so worker processes can run it.
+    
+    Args:
+        operation (str): What we're doing (addition/subtraction/multiplication)
+        matrix1 (SparseMatrix): Left-hand matrix
+        matrix2 (SparseMatrix): Right-hand matrix
+        
+    Returns:
+        SparseMatrix: The result
+    """
+    method_name = OPERATIONS[operation][0]
+    return getattr(matrix1, method_name)(matrix2)
+
+def run_operation(operation: str, matrix1: SparseMatrix,
+                  matrix2: SparseMatrix) -> Optional[SparseMatrix]:
+    """
+    Do one operation on matrices we already loaded. 🧮
+    
+    Args:
+        operation (str): What we're doing (addition/subtraction/multiplication)
+        matrix1 (SparseMatrix): Left-hand matrix
+        matrix2 (SparseMatrix): Right-hand matrix
+        
+    Returns:
+        Optional[SparseMatrix]: The result (or None if something went wrong)
+    """
+    try:
+        if not sizes_fit(operation, matrix1, matrix2):
+            return None
+        return compute_operation(operation, matrix1, matrix2)
             
     except ValueError as e:
         print(f"\n❌ Error during {operation}: {str(e)}")
@@ -223,11 +432,131 @@ def perform_operation(operation: str) -> Optional[SparseMatrix]:
     
     return None
 
+def perform_operation(operation: str) -> Optional[SparseMatrix]:
+    """
+    Do the matrix math! ✨
+    
+    Args:
+        operation (str): What we're doing (addition/subtraction/multiplication)
+        
+    Returns:
+        Optional[SparseMatrix]: The result (or None if something went wrong)
+    """
+    matrices = load_matrix_pair()
+    if matrices is None:
+        return None
+    matrix1, matrix2 = matrices
+    
+    # Show what i'm working with
+    print(f"\n🎯 Operation: {operation}")
+    print(f"📌 Matrix 1: {matrix1}")
+    print(f"📌 Matrix 2: {matrix2}")
+    
+    return run_operation(operation, matrix1, matrix2)
+
+def perform_all_ops(matrix1: SparseMatrix, matrix2: SparseMatrix) -> Dict[str, SparseMatrix]:
+    """
+    Run every operation on one pair of matrices - load once, compute three times! 🔁
+    
+    Addition and subtraction go first while both matrices are still fresh,
+    then multiplication. Operations the sizes don't allow are skipped.
+    
+    Args:
+        matrix1 (SparseMatrix): Left-hand matrix
+        matrix2 (SparseMatrix): Right-hand matrix
+        
+    Returns:
+        Dict[str, SparseMatrix]: Result of each operation that worked, by operation name
+    """
+    print(f"\n🎯 Operations: {', '.join(OPERATIONS)}")
+    print(f"📌 Matrix 1: {matrix1}")
+    print(f"📌 Matrix 2: {matrix2}")
+    
+    results = {}
+    for operation in OPERATIONS:
+        result = run_operation(operation, matrix1, matrix2)
+        if result is not None:
+            results[operation] = result
+    return results
+
+def compute_and_save(operation: str, matrix1: SparseMatrix,
+                     matrix2: SparseMatrix) -> Tuple[str, dict]:
+    """
+    Worker job: do one operation and save it straight to disk. 🏭
+    
+    Only the file name and statistics travel back, which is much cheaper
+    than sending the whole result matrix back to the main process.
+    
+    Args:
+        operation (str): What we're doing (addition/subtraction/multiplication)
+        matrix1 (SparseMatrix): Left-hand matrix
+        matrix2 (SparseMatrix): Right-hand matrix
+        
+    Returns:
+        Tuple[str, dict]: Name of the saved file and the result's statistics
+    """
+    result = compute_operation(operation, matrix1, matrix2)
+    return write_result(result, operation), result.get_statistics()
+
+def perform_all_ops_parallel(matrix1: SparseMatrix, matrix2: SparseMatrix) -> Dict[str, str]:
+    """
+    Run and save every operation at the same time, one worker process each! ⚡
+    
+    The operations don't depend on each other, so separate processes can
+    compute and write their results side by side. Starting workers and
+    copying the matrices to them costs a little, so this pays off on big
+    matrices.
+    
+    Args:
+        matrix1 (SparseMatrix): Left-hand matrix
+        matrix2 (SparseMatrix): Right-hand matrix
+        
+    Returns:
+        Dict[str, str]: Name of the saved file for each operation that worked
+    """
+    print(f"\n🎯 Operations (in parallel): {', '.join(OPERATIONS)}")
+    print(f"📌 Matrix 1: {matrix1}")
+    print(f"📌 Matrix 2: {matrix2}")
+    
+    operations = [op for op in OPERATIONS if sizes_fit(op, matrix1, matrix2)]
+    saved = {}
+    if not operations:
+        return saved
+        
+    # Create it here so the workers don't race to make it
+    ensure_results_directory()
+    
+    workers = min(len(operations), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            operation: executor.submit(compute_and_save, operation, matrix1, matrix2)
+            for operation in operations
+        }
+        for operation, future in futures.items():
+            try:
+                filename, stats = future.result()
+            except ValueError as e:
+                print(f"\n❌ Error during {operation}: {str(e)}")
+                continue
+            except IOError as e:
+                print(f"\n❌ Couldn't save {operation} result: {str(e)}")
+                continue
+            except Exception as e:
+                print(f"\n💥 Unexpected error during {operation}: {str(e)}")
+                continue
+                
+            print(f"\n💾 {operation.capitalize()} result saved to: {filename}")
+            print("\n📊 Result Statistics:")
+            print_statistics(stats)
+            saved[operation] = filename
+    return saved
+
 def main() -> None:
     """Let's get calculating! 🚀"""
     print("🎉 Welcome to Sparse Matrix Calculator! 🎉")
     print("Made with ❤️  by Miracle")
     print("Last updated: 2025-02-19 13:11:24")
+    setup_path_completion()
     
     while True:
         try:
@@ -259,8 +588,19 @@ def main() -> None:
                 print("Hope to see you again soon! ✨")
                 break
                 
+            elif choice == '6':
+                matrices = load_matrix_pair()
+                if matrices:
+                    for operation, result in perform_all_ops(*matrices).items():
+                        save_result(result, operation)
+                    
+            elif choice == '7':
+                matrices = load_matrix_pair()
+                if matrices:
+                    perform_all_ops_parallel(*matrices)
+                
             else:
-                print("\n❌ Oops! Please enter a number between 1 and 5.")
+                print("\n❌ Oops! Please enter a number between 1 and 7.")
                 
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye! Thanks for using Sparse Matrix Calculator!")
@@ -7,8 +7,320 @@ This module implements a sparse matrix class that efficiently stores
 only non-zero elements using a dictionary-based storage format.
 """
 
-from typing import Dict, Tuple, List, Union
+from typing import Dict, Tuple, List, Union, Sequence, Optional, BinaryIO, Iterator
+from array import array
+from itertools import accumulate, compress, islice, repeat
+from operator import gt, le, ne
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 import os
+import re
+import struct
+import sys
+import threading
+
+# Buffer size for writing matrix files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# A well-formed element line such as "(0, 381, -694)"; anything else goes
+# through the slower split-based parse, which reports the exact problem
+_ELEMENT_LINE = re.compile(r'\(\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*\)')
+
+# Binary matrix files: magic, then rows, cols and nnz as little-endian uint64,
+# followed by the CSR indptr, indices and data arrays as little-endian int64
+BINARY_MAGIC = b"SPMX"
+_BINARY_HEADER = struct.Struct("<4sQQQ")
+
+# Compressed sparse row arrays: (indptr, indices, data)
+CSRArrays = Tuple[array, array, Union[array, List[int]]]
+
+def _index_typecode(limit: int) -> str:
+    """
+    Pick the smallest signed array typecode that can hold indices below limit.
+    
+    Column index arrays use it, so most matrices need 2 or 4 bytes per
+    element instead of 8.
+    
+    Args:
+        limit (int): Upper bound (exclusive) of the indices to store
+        
+    Returns:
+        str: 'h', 'i' or 'q'
+    """
+    for typecode in ('h', 'i'):
+        if limit <= 1 << (8 * array(typecode).itemsize - 1):
+            return typecode
+    return 'q'
+
+# A parallel product gives each worker at least this many of the left
+# operand's non-zeros; below it, starting a worker costs more than it saves
+_PARALLEL_MIN_NNZ = 100_000
+
+# Upper bound on worker processes for one product: every worker receives its
+# own copy of the right operand
+_PARALLEL_MAX_WORKERS = 8
+
+# save_to_file sorts a dict-backed matrix's keys when it has fewer than one
+# element per this many rows; building CSR arrays costs O(rows) however few
+# elements there are
+_SORTED_SAVE_ROWS_PER_ELEMENT = 16
+
+def _nonempty_rows(indptr: array, row_start: int, row_end: int) -> Iterator[int]:
+    """
+    Iterate over the rows in row_start..row_end-1 that hold at least one element.
+    
+    The scan over indptr runs at C level, so matrices with millions of empty
+    rows don't pay a Python-level step for each of them.
+    
+    Args:
+        indptr (array): CSR row offsets
+        row_start (int): First row to consider
+        row_end (int): Row to stop before
+        
+    Returns:
+        Iterator[int]: Indices of the non-empty rows, in ascending order
+    """
+    return compress(range(row_start, row_end),
+                    map(ne, islice(indptr, row_start + 1, row_end + 1),
+                        islice(indptr, row_start, row_end)))
+
+# Per-thread scratch lists for _spgemm, kept between products
+_scratch = threading.local()
+
+# Scratch lists longer than this (about 1 MB for both) are dropped after each
+# product instead of staying allocated for the rest of the session
+_SPGEMM_SCRATCH_KEEP = 1 << 16
+
+def _spgemm_scratch(b_cols: int, num_rows: int) -> Tuple[List[int], List[int], int]:
+    """
+    Get the SMMP scratch lists for a product and a block of unused row tags.
+    
+    The lists are reused by later products on the same thread, growing as
+    needed, until _release_spgemm_scratch drops them for being too long. Each
+    product tags its rows with numbers no earlier product has used, so entries
+    left over from before never match and the lists never need clearing.
+    
+    Args:
+        b_cols (int): Number of columns of the right operand
+        num_rows (int): Number of row tags to reserve
+        
+    Returns:
+        Tuple[List[int], List[int], int]: The sums and last_tag lists (at least
+            b_cols long) and the first reserved tag
+    """
+    if getattr(_scratch, 'sums', None) is None or len(_scratch.sums) < b_cols:
+        _scratch.sums = [0] * b_cols
+        _scratch.last_tag = [-1] * b_cols
+        _scratch.next_tag = 0
+    first_tag = _scratch.next_tag
+    _scratch.next_tag = first_tag + num_rows
+    return _scratch.sums, _scratch.last_tag, first_tag
+
+def _release_spgemm_scratch() -> None:
+    """
+    Drop this thread's SMMP scratch lists if they are too long to keep.
+    
+    Lists for a very wide right operand would otherwise pin their memory, and
+    the sums from that product, until the thread ends.
+    """
+    if len(_scratch.sums) > _SPGEMM_SCRATCH_KEEP:
+        _scratch.sums = _scratch.last_tag = None
+
+def _spgemm(a_indptr: array, a_indices: array, a_data: Union[array, List[int]],
+            b_indptr: array, b_indices: array, b_data: Union[array, List[int]],
+            b_cols: int, row_start: int, row_end: int) -> CSRArrays:
+    """
+    Multiply rows row_start..row_end-1 of A by B, both given as CSR arrays.
+    
+    Row i of the product is the sum of A[i, k] * (row k of B) over the non-zeros
+    of A's row i (Gustavson's algorithm). The kernel works on the raw arrays
+    only, so it can be handed to a worker process or swapped for a compiled
+    version without touching SparseMatrix.
+    
+    Args:
+        a_indptr, a_indices, a_data: CSR arrays of the left operand
+        b_indptr, b_indices, b_data: CSR arrays of the right operand
+        b_cols (int): Number of columns of the right operand
+        row_start (int): First row of A to multiply
+        row_end (int): Row of A to stop before
+        
+    Returns:
+        CSRArrays: The product rows as (indptr, indices, data), with indptr
+            starting at 0 for row_start and columns ascending within each row
+    """
+    indptr = array('q', [0])
+    col_indices: List[int] = []
+    values: List[int] = []
+    
+    # Scratch space shared by all rows (SMMP): sums[j] holds the running
+    # total for column j and is only valid while last_tag[j] is the row's tag
+    sums, last_tag, first_tag = _spgemm_scratch(b_cols, row_end - row_start)
+    tag_offset = first_tag - row_start
+    
+    for i in _nonempty_rows(a_indptr, row_start, row_end):
+        # Rows skipped since the last non-empty one produced nothing
+        indptr.extend(repeat(len(values), i - row_start + 1 - len(indptr)))
+        
+        tag = tag_offset + i
+        touched: List[int] = []
+        for p in range(a_indptr[i], a_indptr[i + 1]):
+            k = a_indices[p]
+            a_ik = a_data[p]
+            for q in range(b_indptr[k], b_indptr[k + 1]):
+                j = b_indices[q]
+                if last_tag[j] != tag:
+                    last_tag[j] = tag
+                    sums[j] = a_ik * b_data[q]
+                    touched.append(j)
+                else:
+                    sums[j] += a_ik * b_data[q]
+                    
+        touched.sort()
+        for j in touched:
+            total = sums[j]
+            if total != 0:
+                col_indices.append(j)
+                values.append(total)
+        indptr.append(len(values))
+    indptr.extend(repeat(len(values), row_end - row_start + 1 - len(indptr)))
+    
+    _release_spgemm_scratch()
+    return indptr, array(_index_typecode(b_cols), col_indices), _value_array(values)
+
+def _spgemm_parallel(a_csr: CSRArrays, b_csr: CSRArrays, b_cols: int, num_rows: int,
+                     workers: int) -> CSRArrays:
+    """
+    Multiply two matrices given as CSR arrays, splitting A's rows over worker processes.
+    
+    Each worker runs _spgemm on a block of rows holding about the same number
+    of A's non-zeros, and the blocks are joined back together in row order.
+    Only the block's slice of A is sent to its worker, with indptr rebased to
+    start at zero.
+    
+    Args:
+        a_csr (CSRArrays): CSR arrays of the left operand
+        b_csr (CSRArrays): CSR arrays of the right operand
+        b_cols (int): Number of columns of the right operand
+        num_rows (int): Number of rows of the left operand
+        workers (int): Number of worker processes
+        
+    Returns:
+        CSRArrays: The product as (indptr, indices, data)
+    """
+    a_indptr, a_indices, a_data = a_csr
+    nnz = a_indptr[-1]
+    
+    # Block boundaries: the first row at or past each equal share of non-zeros
+    bounds = [0]
+    for block in range(1, workers):
+        bounds.append(max(bounds[-1], bisect_left(a_indptr, nnz * block // workers)))
+    bounds.append(num_rows)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for start, end in zip(bounds, bounds[1:]):
+            if start == end:
+                continue
+            low, high = a_indptr[start], a_indptr[end]
+            block_indptr = array('q', [offset - low for offset in a_indptr[start:end + 1]])
+            futures.append(executor.submit(
+                _spgemm, block_indptr, a_indices[low:high], a_data[low:high],
+                *b_csr, b_cols, 0, end - start))
+        blocks = [future.result() for future in futures]
+    
+    indptr = array('q', [0])
+    indices = array(_index_typecode(b_cols))
+    for block_indptr, block_indices, _ in blocks:
+        offset = indptr[-1]
+        indptr.extend(offset + end for end in block_indptr[1:])
+        indices.extend(block_indices)
+        
+    if all(isinstance(block_data, array) for _, _, block_data in blocks):
+        data: Union[array, List[int]] = array('q')
+        for _, _, block_data in blocks:
+            data.extend(block_data)
+    else:
+        data = [value for _, _, block_data in blocks for value in block_data]
+    
+    return indptr, indices, data
+
+def _merge_csr(a_indptr: array, a_indices: array, a_data: Union[array, List[int]],
+               b_indptr: array, b_indices: array, b_data: Union[array, List[int]],
+               sign: int, num_rows: int) -> CSRArrays:
+    """
+    Compute A + sign * B for two matrices of the same shape given as CSR arrays.
+    
+    Each row is a two-pointer merge of the rows' sorted column indices, so no
+    hashing is needed and the result comes out already in CSR order. Only rows
+    that are non-empty in A or B are visited.
+    
+    Args:
+        a_indptr, a_indices, a_data: CSR arrays of the left operand
+        b_indptr, b_indices, b_data: CSR arrays of the right operand
+        sign (int): 1 to add, -1 to subtract
+        num_rows (int): Number of rows of both operands
+        
+    Returns:
+        CSRArrays: The result as (indptr, indices, data)
+    """
+    indptr = array('q', [0])
+    col_indices: List[int] = []
+    values: List[int] = []
+    
+    rows = sorted({*_nonempty_rows(a_indptr, 0, num_rows), *_nonempty_rows(b_indptr, 0, num_rows)})
+    for i in rows:
+        # Rows skipped since the last non-empty one are empty in the result too
+        indptr.extend(repeat(len(values), i + 1 - len(indptr)))
+        
+        p, p_end = a_indptr[i], a_indptr[i + 1]
+        q, q_end = b_indptr[i], b_indptr[i + 1]
+        while p < p_end and q < q_end:
+            a_col = a_indices[p]
+            b_col = b_indices[q]
+            if a_col < b_col:
+                col_indices.append(a_col)
+                values.append(a_data[p])
+                p += 1
+            elif b_col < a_col:
+                col_indices.append(b_col)
+                values.append(sign * b_data[q])
+                q += 1
+            else:
+                total = a_data[p] + sign * b_data[q]
+                if total != 0:
+                    col_indices.append(a_col)
+                    values.append(total)
+                p += 1
+                q += 1
+                
+        # At most one of the rows has elements left; copy them in one go
+        col_indices.extend(a_indices[p:p_end])
+        values.extend(a_data[p:p_end])
+        col_indices.extend(b_indices[q:q_end])
+        if sign == 1:
+            values.extend(b_data[q:q_end])
+        else:
+            values.extend(-value for value in b_data[q:q_end])
+        indptr.append(len(values))
+    indptr.extend(repeat(len(values), num_rows + 1 - len(indptr)))
+    
+    return indptr, array(a_indices.typecode, col_indices), _value_array(values)
+
+def _value_array(values: List[int]) -> Union[array, List[int]]:
+    """
+    Pack element values into an int64 array when they fit.
+    
+    Args:
+        values (List[int]): Element values
+        
+    Returns:
+        Union[array, List[int]]: The values as array('q'), or the list itself
+            if some value needs more than 64 bits
+    """
+    try:
+        return array('q', values)
+    except OverflowError:
+        return values  # Keep arbitrary-precision values as a plain list
 
 class SparseMatrix:
     """
@@ -16,27 +328,38 @@ class SparseMatrix:
     
     This implementation stores only non-zero elements in a dictionary where the key is a tuple
     of (row, col) and the value is the non-zero element. This makes it memory efficient for
-    matrices with many zero elements.
+    matrices with many zero elements. Operations that walk whole rows (such as multiplication)
+    use a compressed sparse row (CSR) copy that is built on demand and, like the statistics,
+    cached until the matrix is next modified. Matrices produced as CSR arrays (products and
+    binary files) are stored as just those arrays until the dictionary is first needed.
     
     Attributes:
         rows (int): Number of rows in the matrix
         cols (int): Number of columns in the matrix
-        elements (Dict[Tuple[int, int], int]): Dictionary storing non-zero elements
+        elements (Dict[Tuple[int, int], int]): Dictionary storing non-zero elements,
+            built from the CSR arrays on first access when the matrix has no dictionary yet
     """
     
-    def __init__(self, matrix_file_path: str = None, num_rows: int = 0, num_cols: int = 0):
+    # Every operation creates a new matrix, so skip the per-instance __dict__
+    __slots__ = ('rows', 'cols', '_elements', '_csr', '_stats')
+    
+    def __init__(self, matrix_file_path: Union[str, BinaryIO] = None, num_rows: int = 0,
+                 num_cols: int = 0):
         """
         Initialize sparse matrix either from file or with given dimensions.
         
         Args:
-            matrix_file_path (str, optional): Path to input file containing matrix data
+            matrix_file_path (Union[str, BinaryIO], optional): Path to input file containing
+                matrix data, or that file already opened in binary mode
             num_rows (int, optional): Number of rows if creating empty matrix
             num_cols (int, optional): Number of columns if creating empty matrix
             
         Raises:
             ValueError: If file format is invalid or dimensions are negative
         """
-        self.elements: Dict[Tuple[int, int], int] = {}
+        self._elements: Optional[Dict[Tuple[int, int], int]] = {}
+        self._csr: Optional[CSRArrays] = None
+        self._stats: Optional[dict] = None
         
         if matrix_file_path:
             self._load_from_file(matrix_file_path)
@@ -75,85 +398,315 @@ class SparseMatrix:
         except ValueError:
             raise ValueError("Invalid number format in headers")
 
-    def _load_from_file(self, file_path: str) -> None:
+    def _load_from_file(self, file_path: Union[str, BinaryIO]) -> None:
         """
         Load matrix data from a file.
         
+        The whole file is read in one call and, when every element line is
+        well-formed, parsed in bulk. Anything unusual falls back to the
+        line-by-line parser so errors still report the offending line. Files
+        written by save_binary are recognised by their SPMX header and loaded
+        as CSR arrays instead.
+        
         Args:
-            file_path (str): Path to the input file
+            file_path (Union[str, BinaryIO]): Path to the input file, or the file
+                opened in binary mode (read from its current position, not closed)
             
         Raises:
             ValueError: If file format is invalid
             FileNotFoundError: If file doesn't exist
         """
+        if hasattr(file_path, 'read'):
+            data = file_path.read()
+        else:
+            try:
+                with open(file_path, 'rb') as file:
+                    data = file.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Could not open file: {file_path}")
+        
+        if data.startswith(BINARY_MAGIC):
+            self.rows, self.cols, self._csr = self._parse_binary(data)
+            self._elements = None  # Built from the CSR arrays when first needed
+            print(f"Successfully loaded {self.nnz} elements")
+            return
+        
+        # Read lines the way text mode does: \r\n and a lone \r both end a line
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        # Split off the two header lines, keeping the body as one buffer
+        parts = data.split(b'\n', 2)
+        
+        rows_line = parts[0].strip().decode()
+        if not rows_line:
+            raise ValueError("File is empty")
+            
+        cols_line = parts[1].strip().decode() if len(parts) > 1 else ''
+        if not cols_line:
+            raise ValueError("Missing columns specification")
+        
+        # Process headers
+        self.rows, self.cols = self._process_header(rows_line, cols_line)
+        
+        body = parts[2] if len(parts) > 2 else b''
+        if not self._load_body_fast(body):
+            self._load_body_lines(body)
+
+    def _load_body_fast(self, body: bytes) -> bool:
+        """
+        Parse all element lines at once with bulk bytes operations.
+        
+        Spaces are stripped and the whole body is split into numbers with a
+        handful of C-level calls, then converted by a single map(int, ...).
+        Out-of-bounds elements are skipped with a warning naming their line,
+        as in the line-by-line parser.
+        
+        Args:
+            body (bytes): File contents after the header lines
+            
+        Returns:
+            bool: True if the body was loaded, False if it needs the line-by-line parser
+        """
+        # Non-blank lines with surrounding whitespace stripped and spaces removed
+        lines = list(filter(None, map(bytes.strip, body.replace(b' ', b'').split(b'\n'))))
+        count = len(lines)
+        text = b'\n'.join(lines)
+        
+        # Every line must be exactly one "(...)": a "(" only at line starts and
+        # a ")" only at line ends
+        if count and not (
+                text.startswith(b'(') and text.endswith(b')')
+                and text.count(b'(') == count and text.count(b')') == count
+                and text.count(b')\n(') == count - 1):
+            return False
+            
+        tokens = text[1:-1].replace(b')\n(', b',').split(b',') if count else []
+        if len(tokens) != 3 * count:
+            return False
         try:
-            with open(file_path, 'r') as file:
-                # Read headers
-                rows_line = file.readline().strip()
-                if not rows_line:
-                    raise ValueError("File is empty")
-                    
-                cols_line = file.readline().strip()
-                if not cols_line:
-                    raise ValueError("Missing columns specification")
+            numbers = list(map(int, tokens))
+        except ValueError:
+            return False
+            
+        row_indices = numbers[0::3]
+        col_indices = numbers[1::3]
+        values = numbers[2::3]
+        
+        invalid_elements = 0
+        try:
+            self._insert_all(row_indices, col_indices, values)
+        except ValueError:
+            # Some elements are out of bounds: warn about and skip just those
+            in_bounds = [
+                0 <= row < self.rows and 0 <= col < self.cols
+                for row, col in zip(row_indices, col_indices)
+            ]
+            element = 0
+            for line_num, line in enumerate(body.split(b'\n'), 3):  # The body starts on line 3
+                line = line.strip()
+                if not line:
+                    continue
+                if not in_bounds[element]:
+                    print(f"Warning: Skipping out-of-bounds element at line {line_num}: "
+                          f"{line.decode()}")
+                    invalid_elements += 1
+                element += 1
                 
-                # Process headers
-                self.rows, self.cols = self._process_header(rows_line, cols_line)
+            self._insert_all(list(compress(row_indices, in_bounds)),
+                             list(compress(col_indices, in_bounds)),
+                             list(compress(values, in_bounds)))
+        
+        print(f"Successfully loaded {count - invalid_elements} elements")
+        if invalid_elements > 0:
+            print(f"Skipped {invalid_elements} invalid elements")
+        return True
+
+    def _load_body_lines(self, body: bytes) -> None:
+        """
+        Parse element lines one at a time, reporting problems by line number.
+        
+        Args:
+            body (bytes): File contents after the header lines
+            
+        Raises:
+            ValueError: If an element line is malformed
+        """
+        line_num = 2  # Start counting from line 3 (0-based index + 2 header lines)
+        elements_loaded = 0
+        invalid_elements = 0
+        
+        for line in body.decode().split('\n'):
+            line_num += 1
+            line = line.strip()
+            if not line:  # Skip empty lines
+                continue
+            
+            match = _ELEMENT_LINE.fullmatch(line)
+            if match:
+                row, col, value = int(match[1]), int(match[2]), int(match[3])
+                if 0 <= row < self.rows and 0 <= col < self.cols:
+                    self._put(row, col, value)
+                    elements_loaded += 1
+                    continue
+            
+            # Validate format
+            if not (line.startswith('(') and line.endswith(')')):
+                raise ValueError(
+                    f"Invalid element format at line {line_num}: {line}\n"
+                    f"Expected format: (row, col, value)"
+                )
+            
+            try:
+                # Parse (row, col, value)
+                content = line[1:-1].replace(' ', '')  # Remove parentheses and spaces
+                parts = content.split(',')
                 
-                # Read matrix elements
-                line_num = 2  # Start counting from line 3 (0-based index + 2 header lines)
-                elements_loaded = 0
-                invalid_elements = 0
+                if len(parts) != 3:
+                    raise ValueError(
+                        f"Invalid element format at line {line_num}: {line}\n"
+                        f"Expected three comma-separated values: (row, col, value)"
+                    )
+                    
+                row, col, value = map(int, parts)
                 
-                for line in file:
-                    line_num += 1
-                    line = line.strip()
-                    if not line:  # Skip empty lines
-                        continue
+                # Skip elements that are out of bounds but warn user
+                if not (0 <= row < self.rows and 0 <= col < self.cols):
+                    print(f"Warning: Skipping out-of-bounds element at line {line_num}: {line}")
+                    invalid_elements += 1
+                    continue
                     
-                    # Validate format
-                    if not (line.startswith('(') and line.endswith(')')):
-                        raise ValueError(
-                            f"Invalid element format at line {line_num}: {line}\n"
-                            f"Expected format: (row, col, value)"
-                        )
+                self._put(row, col, value)
+                elements_loaded += 1
                     
-                    try:
-                        # Parse (row, col, value)
-                        content = line[1:-1].replace(' ', '')  # Remove parentheses and spaces
-                        parts = content.split(',')
-                        
-                        if len(parts) != 3:
-                            raise ValueError(
-                                f"Invalid element format at line {line_num}: {line}\n"
-                                f"Expected three comma-separated values: (row, col, value)"
-                            )
-                            
-                        row, col, value = map(int, parts)
-                        
-                        # Skip elements that are out of bounds but warn user
-                        if not (0 <= row < self.rows and 0 <= col < self.cols):
-                            print(f"Warning: Skipping out-of-bounds element at line {line_num}: {line}")
-                            invalid_elements += 1
-                            continue
-                            
-                        self.set_element(row, col, value)
-                        elements_loaded += 1
-                            
-                    except ValueError as e:
-                        if str(e).startswith("Invalid element format"):
-                            raise
-                        raise ValueError(
-                            f"Invalid number format at line {line_num}: {line}\n"
-                            f"All values must be integers"
-                        )
+            except ValueError as e:
+                if str(e).startswith("Invalid element format"):
+                    raise
+                raise ValueError(
+                    f"Invalid number format at line {line_num}: {line}\n"
+                    f"All values must be integers"
+                )
+        
+        print(f"Successfully loaded {elements_loaded} elements")
+        if invalid_elements > 0:
+            print(f"Skipped {invalid_elements} invalid elements")
+
+    @classmethod
+    def from_arrays(cls, num_rows: int, num_cols: int, row_indices: Sequence[int],
+                    col_indices: Sequence[int], values: Sequence[int]) -> 'SparseMatrix':
+        """
+        Build a matrix from parallel sequences of coordinates and values.
+        
+        Args:
+            num_rows (int): Number of rows
+            num_cols (int): Number of columns
+            row_indices (Sequence[int]): Row index of each element
+            col_indices (Sequence[int]): Column index of each element
+            values (Sequence[int]): Value of each element
+            
+        Returns:
+            SparseMatrix: New matrix holding the given elements
+            
+        Raises:
+            ValueError: If the sequences differ in length or an index is out of bounds
+        """
+        if not (len(row_indices) == len(col_indices) == len(values)):
+            raise ValueError(
+                f"Coordinate and value sequences must have the same length: "
+                f"{len(row_indices)}, {len(col_indices)}, {len(values)}"
+            )
+        
+        matrix = cls(num_rows=num_rows, num_cols=num_cols)
+        matrix._insert_all(row_indices, col_indices, values)
+        return matrix
+
+    def _insert_all(self, row_indices: Sequence[int], col_indices: Sequence[int],
+                    values: Sequence[int]) -> None:
+        """
+        Set many elements at once; later entries overwrite earlier ones.
+        
+        Args:
+            row_indices (Sequence[int]): Row index of each element
+            col_indices (Sequence[int]): Column index of each element
+            values (Sequence[int]): Value of each element
+            
+        Raises:
+            ValueError: If any index is out of bounds (nothing is stored in that case)
+        """
+        # Validate all indices with four C-level reductions; only when they
+        # fail, look for the first offending element to report
+        if row_indices and (
+                min(row_indices) < 0 or max(row_indices) >= self.rows
+                or min(col_indices) < 0 or max(col_indices) >= self.cols):
+            for row, col in zip(row_indices, col_indices):
+                self._validate_indices(row, col)
+        
+        elements = self._element_dict()
+        self._csr = None
+        self._stats = None
+        elements.update(zip(zip(row_indices, col_indices), values))
+        if 0 in values:
+            # A zero entry clears its position, even if set earlier
+            self.elements = {key: value for key, value in elements.items() if value != 0}
+
+    @property
+    def elements(self) -> Dict[Tuple[int, int], int]:
+        """
+        Dictionary of non-zero elements keyed by (row, col).
+        
+        Matrices built from CSR arrays (products, binary files) only get this
+        dictionary when it is first used. The caller may change the dictionary
+        it gets, so the cached CSR arrays and statistics are dropped and get
+        rebuilt from it when next needed. A dictionary kept from an earlier
+        access should be fetched again after calling other methods.
+        
+        Returns:
+            Dict[Tuple[int, int], int]: The non-zero elements
+        """
+        elements = self._element_dict()
+        self._csr = None
+        self._stats = None
+        return elements
+
+    @elements.setter
+    def elements(self, elements: Dict[Tuple[int, int], int]) -> None:
+        self._elements = elements
+        self._csr = None
+        self._stats = None
+
+    def _element_dict(self) -> Dict[Tuple[int, int], int]:
+        """
+        Get the element dictionary for internal use, building it if needed.
+        
+        Unlike the elements property this keeps the cached CSR arrays and
+        statistics, so callers must not change the dictionary without
+        dropping them.
+        
+        Returns:
+            Dict[Tuple[int, int], int]: The non-zero elements
+        """
+        if self._elements is None:
+            indptr, indices, data = self._csr
+            
+            # Expand the row offsets into one row index per element
+            row_indices: List[int] = []
+            for row in _nonempty_rows(indptr, 0, self.rows):
+                row_indices.extend(repeat(row, indptr[row + 1] - indptr[row]))
                 
-                print(f"Successfully loaded {elements_loaded} elements")
-                if invalid_elements > 0:
-                    print(f"Skipped {invalid_elements} invalid elements")
-                        
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Could not open file: {file_path}")
+            self._elements = dict(zip(zip(row_indices, indices), data))
+        return self._elements
+
+    @property
+    def nnz(self) -> int:
+        """
+        Number of stored non-zero elements.
+        
+        Returns:
+            int: Count of non-zero elements
+        """
+        if self._elements is None:
+            return self._csr[0][-1]
+        return len(self._elements)
 
     def get_element(self, row: int, col: int) -> int:
         """
@@ -169,8 +722,15 @@ class SparseMatrix:
         Raises:
             ValueError: If indices are out of bounds
         """
-        self._validate_indices(row, col)
-        return self.elements.get((row, col), 0)
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            self._validate_indices(row, col)  # Builds the error message and raises
+        if self._elements is None:
+            # Binary search the row's sorted column indices
+            indptr, indices, data = self._csr
+            end = indptr[row + 1]
+            pos = bisect_left(indices, col, indptr[row], end)
+            return data[pos] if pos < end and indices[pos] == col else 0
+        return self._elements.get((row, col), 0)
 
     def set_element(self, row: int, col: int, value: int) -> None:
         """
@@ -184,11 +744,90 @@ class SparseMatrix:
         Raises:
             ValueError: If indices are out of bounds
         """
-        self._validate_indices(row, col)
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            self._validate_indices(row, col)  # Builds the error message and raises
+        self._put(row, col, value)
+
+    def _put(self, row: int, col: int, value: int) -> None:
+        """
+        Set an element whose indices are already known to be in bounds.
+        
+        Internal builders use this to skip set_element's per-call validation.
+        
+        Args:
+            row (int): Row index
+            col (int): Column index
+            value (int): Value to set
+        """
+        elements = self._element_dict()
+        self._csr = None
+        self._stats = None
         if value != 0:
-            self.elements[(row, col)] = value
-        elif (row, col) in self.elements:
-            del self.elements[(row, col)]
+            elements[(row, col)] = value
+        else:
+            elements.pop((row, col), None)
+
+    def _to_csr(self) -> CSRArrays:
+        """
+        Get the matrix in compressed sparse row (CSR) form.
+        
+        The column indices and values of row i are indices[indptr[i]:indptr[i+1]]
+        and data[indptr[i]:indptr[i+1]], with columns in ascending order. The
+        arrays are built on first use and reused until the matrix is modified.
+        
+        Returns:
+            CSRArrays: Tuple of (indptr, indices, data)
+        """
+        if self._csr is None:
+            # Counting sort by row: count each row's elements, turn the counts
+            # into row offsets, then scatter every element into its row's slot
+            elements = self._elements
+            row_counts = array('q', bytes(8 * self.rows))
+            for row, _ in elements:
+                row_counts[row] += 1
+            indptr = array('q', [0])
+            indptr.extend(accumulate(row_counts))
+            
+            next_slot = array('q', indptr)
+            col_indices: List[int] = [0] * len(elements)
+            values: List[int] = [0] * len(elements)
+            for (row, col), value in elements.items():
+                slot = next_slot[row]
+                next_slot[row] = slot + 1
+                col_indices[slot] = col
+                values[slot] = value
+                
+            # Only rows holding more than one element need their columns sorted
+            for row in compress(range(self.rows), map((1).__lt__, row_counts)):
+                start, end = indptr[row], indptr[row + 1]
+                row_elements = sorted(zip(col_indices[start:end], values[start:end]))
+                col_indices[start:end] = [col for col, _ in row_elements]
+                values[start:end] = [value for _, value in row_elements]
+                
+            self._csr = (indptr, array(_index_typecode(self.cols), col_indices),
+                         _value_array(values))
+        return self._csr
+
+    @classmethod
+    def _from_csr(cls, num_rows: int, num_cols: int, indptr: array, indices: array,
+                  data: Union[array, List[int]]) -> 'SparseMatrix':
+        """
+        Build a matrix from CSR arrays, keeping them as its storage.
+        
+        Args:
+            num_rows (int): Number of rows
+            num_cols (int): Number of columns
+            indptr (array): Row offsets into indices/data (num_rows + 1 entries)
+            indices (array): Column index of each element, ascending within a row
+            data (Union[array, List[int]]): Non-zero value of each element
+            
+        Returns:
+            SparseMatrix: New matrix holding the given elements
+        """
+        matrix = cls(num_rows=num_rows, num_cols=num_cols)
+        matrix._elements = None  # Built from the CSR arrays when first needed
+        matrix._csr = (indptr, indices, data)
+        return matrix
 
     def _validate_indices(self, row: int, col: int) -> None:
         """
@@ -220,23 +859,7 @@ class SparseMatrix:
         Raises:
             ValueError: If matrix dimensions don't match
         """
-        if self.rows != other.rows or self.cols != other.cols:
-            raise ValueError(
-                f"Matrix dimensions must match for addition: "
-                f"({self.rows}, {self.cols}) != ({other.rows}, {other.cols})"
-            )
-        
-        result = SparseMatrix(num_rows=self.rows, num_cols=self.cols)
-        
-        # Add elements from both matrices
-        for (row, col), value in self.elements.items():
-            result.set_element(row, col, value)
-        
-        for (row, col), value in other.elements.items():
-            current = result.get_element(row, col)
-            result.set_element(row, col, current + value)
-        
-        return result
+        return self._combine(other, 1, "addition")
 
     def subtract(self, other: 'SparseMatrix') -> 'SparseMatrix':
         """
@@ -248,37 +871,89 @@ class SparseMatrix:
         Returns:
             SparseMatrix: Result of subtraction
             
+        Raises:
+            ValueError: If matrix dimensions don't match
+        """
+        return self._combine(other, -1, "subtraction")
+
+    def _combine(self, other: 'SparseMatrix', sign: int, operation: str) -> 'SparseMatrix':
+        """
+        Compute self + sign * other element-wise.
+        
+        The result starts as a copy of this matrix's elements (or, for addition,
+        of the larger matrix's) and the other matrix's elements are folded in
+        with a single pass. Both matrices share
+        the same bounds, so no per-element index validation is needed. When both
+        matrices have CSR arrays and at least one has no dictionary yet, the
+        arrays are merged instead, which avoids building that dictionary; with
+        both dictionaries at hand, folding them is the faster choice.
+        
+        Args:
+            other (SparseMatrix): Matrix to combine with
+            sign (int): 1 to add, -1 to subtract
+            operation (str): Operation name used in error messages
+            
+        Returns:
+            SparseMatrix: Result of the element-wise combination
+            
         Raises:
             ValueError: If matrix dimensions don't match
         """
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError(
-                f"Matrix dimensions must match for subtraction: "
+                f"Matrix dimensions must match for {operation}: "
                 f"({self.rows}, {self.cols}) != ({other.rows}, {other.cols})"
             )
         
+        if (self._csr is not None and other._csr is not None and
+                (self._elements is None or other._elements is None)):
+            return SparseMatrix._from_csr(
+                self.rows, self.cols,
+                *_merge_csr(*self._csr, *other._csr, sign, self.rows)
+            )
+        
         result = SparseMatrix(num_rows=self.rows, num_cols=self.cols)
         
-        # Add elements from first matrix
-        for (row, col), value in self.elements.items():
-            result.set_element(row, col, value)
+        # With nothing to merge into, the result is just the other matrix (negated)
+        if self.nnz == 0:
+            if sign == 1:
+                result.elements = dict(other._element_dict())
+            else:
+                result.elements = {key: -value for key, value in other._element_dict().items()}
+            return result
         
-        # Subtract elements from second matrix
-        for (row, col), value in other.elements.items():
-            current = result.get_element(row, col)
-            result.set_element(row, col, current - value)
+        base, folded = self._element_dict(), other._element_dict()
+        if sign == 1 and len(folded) > len(base):
+            # Addition commutes, so copy the larger dictionary (a C-level copy)
+            # and fold the smaller one into it
+            base, folded = folded, base
         
+        elements = dict(base)
+        current = elements.get
+        
+        for key, value in folded.items():
+            total = current(key, 0) + sign * value
+            if total != 0:
+                elements[key] = total
+            else:
+                del elements[key]  # Only reachable when the key was already present
+        
+        result.elements = elements
         return result
 
-    def multiply(self, other: 'SparseMatrix') -> 'SparseMatrix':
+    def multiply(self, other: 'SparseMatrix', workers: int = 1) -> 'SparseMatrix':
         """
         Multiply two sparse matrices.
         
-        This implementation uses an efficient approach that only processes
-        non-zero elements, making it especially efficient for sparse matrices.
+        Rows of this matrix are combined with rows of the other matrix in CSR
+        form, so the work is proportional to the number of non-zero products
+        rather than to the size of the result.
         
         Args:
             other (SparseMatrix): Matrix to multiply with
+            workers (int, optional): Most processes to split this matrix's rows
+                over; at most _PARALLEL_MAX_WORKERS are used, each given at least
+                _PARALLEL_MIN_NNZ non-zeros, so small products stay in one process
             
         Returns:
             SparseMatrix: Result of multiplication
@@ -292,35 +967,18 @@ class SparseMatrix:
                 f"Matrix 1 columns ({self.cols}) must equal Matrix 2 rows ({other.rows})"
             )
         
-        result = SparseMatrix(num_rows=self.rows, num_cols=other.cols)
-        
-        # Group elements by row and column for efficient multiplication
-        self_rows: Dict[int, Dict[int, int]] = {}
-        other_cols: Dict[int, Dict[int, int]] = {}
-        
-        # Organize first matrix by rows
-        for (row, col), value in self.elements.items():
-            if row not in self_rows:
-                self_rows[row] = {}
-            self_rows[row][col] = value
-        
-        # Organize second matrix by columns
-        for (row, col), value in other.elements.items():
-            if col not in other_cols:
-                other_cols[col] = {}
-            other_cols[col][row] = value
-        
-        # Perform multiplication only for non-zero elements
-        for i in self_rows:
-            for j in other_cols:
-                sum_value = 0
-                for k in self_rows[i]:
-                    if k in other_cols[j]:
-                        sum_value += self_rows[i][k] * other_cols[j][k]
-                if sum_value != 0:
-                    result.set_element(i, j, sum_value)
+        if self.nnz == 0 or other.nnz == 0:
+            # Zero matrix: skip building CSR arrays entirely
+            return SparseMatrix(num_rows=self.rows, num_cols=other.cols)
         
-        return result
+        a_csr = self._to_csr()
+        b_csr = other._to_csr()
+        workers = min(workers, _PARALLEL_MAX_WORKERS, self.nnz // _PARALLEL_MIN_NNZ)
+        if workers > 1:
+            csr = _spgemm_parallel(a_csr, b_csr, other.cols, self.rows, workers)
+        else:
+            csr = _spgemm(*a_csr, *b_csr, other.cols, 0, self.rows)
+        return SparseMatrix._from_csr(self.rows, other.cols, *csr)
 
     def save_to_file(self, file_path: str) -> None:
         """
@@ -333,20 +991,160 @@ class SparseMatrix:
             IOError: If file cannot be written
         """
         try:
-            with open(file_path, 'w') as file:
-                file.write(f"rows={self.rows}\n")
-                file.write(f"cols={self.cols}\n")
-                
-                # Sort elements for consistent output
-                sorted_elements = sorted(self.elements.items())
-                for (row, col), value in sorted_elements:
-                    file.write(f"({row}, {col}, {value})\n")
+            elements = self._elements
+            hypersparse = (self._csr is None and elements is not None and
+                           len(elements) * _SORTED_SAVE_ROWS_PER_ELEMENT < self.rows)
+            
+            # Lines are streamed through a large buffer: few write() calls
+            # without building the whole file in memory first
+            with open(file_path, 'w', buffering=_WRITE_BUFFER_SIZE) as file:
+                file.write(f"rows={self.rows}\ncols={self.cols}\n")
+                if hypersparse:
+                    # Sorting a few keys beats building CSR arrays over every row
+                    file.writelines(
+                        f"({row}, {col}, {value})\n"
+                        for (row, col), value in sorted(elements.items())
+                    )
+                    saved = len(elements)
+                else:
+                    # The CSR arrays already list elements sorted by (row, col),
+                    # which gives consistent output without sorting all keys
+                    indptr, indices, data = self._to_csr()
+                    for row in _nonempty_rows(indptr, 0, self.rows):
+                        start, end = indptr[row], indptr[row + 1]
+                        file.writelines(
+                            f"({row}, {col}, {value})\n"
+                            for col, value in zip(indices[start:end], data[start:end])
+                        )
+                    saved = len(data)
+                    
+            print(f"Saved {saved} elements to {file_path}")
+            
+        except IOError as e:
+            raise IOError(f"Error writing to file {file_path}: {str(e)}")
+
+    def save_binary(self, file_path: str) -> None:
+        """
+        Save matrix to file in the binary CSR format.
+        
+        Binary files are several times smaller than the text format and load
+        without any parsing; see load_binary.
+        
+        Args:
+            file_path (str): Path where to save the matrix
+            
+        Raises:
+            ValueError: If a value does not fit in a signed 64-bit integer
+            IOError: If file cannot be written
+        """
+        indptr, indices, data = self._to_csr()
+        if not isinstance(data, array):
+            raise ValueError("Matrix values do not fit in 64 bits; use save_to_file instead")
+            
+        try:
+            with open(file_path, 'wb') as file:
+                file.write(_BINARY_HEADER.pack(BINARY_MAGIC, self.rows, self.cols, len(data)))
+                for values in (indptr, indices, data):
+                    if values.typecode != 'q' or sys.byteorder == 'big':
+                        values = array('q', values)  # Indices may be held narrower
+                    if sys.byteorder == 'big':
+                        values.byteswap()
+                    values.tofile(file)
                     
-            print(f"Saved {len(self.elements)} elements to {file_path}")
+            print(f"Saved {len(data)} elements to {file_path}")
             
         except IOError as e:
             raise IOError(f"Error writing to file {file_path}: {str(e)}")
 
+    @classmethod
+    def load_binary(cls, file_path: Union[str, BinaryIO]) -> 'SparseMatrix':
+        """
+        Load a matrix saved by save_binary.
+        
+        SparseMatrix(file_path) loads binary files too; this method differs in
+        rejecting anything that isn't one.
+        
+        Args:
+            file_path (Union[str, BinaryIO]): Path to the binary file, or the file
+                opened in binary mode (read from its current position, not closed)
+            
+        Returns:
+            SparseMatrix: The loaded matrix
+            
+        Raises:
+            ValueError: If the file is not a valid binary matrix file
+            FileNotFoundError: If file doesn't exist
+        """
+        if hasattr(file_path, 'read'):
+            data = file_path.read()
+        else:
+            try:
+                with open(file_path, 'rb') as file:
+                    data = file.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Could not open file: {file_path}")
+                
+        rows, cols, csr = cls._parse_binary(data)
+        matrix = cls._from_csr(rows, cols, *csr)
+        print(f"Successfully loaded {matrix.nnz} elements")
+        return matrix
+
+    @staticmethod
+    def _parse_binary(data: bytes) -> Tuple[int, int, CSRArrays]:
+        """
+        Parse and validate the contents of a binary matrix file.
+        
+        Args:
+            data (bytes): Whole contents of the file
+            
+        Returns:
+            Tuple[int, int, CSRArrays]: Rows, columns and the CSR arrays
+            
+        Raises:
+            ValueError: If the data is not a valid binary matrix file
+        """
+        if len(data) < _BINARY_HEADER.size:
+            raise ValueError("Binary matrix file is truncated: incomplete header")
+        magic, rows, cols, nnz = _BINARY_HEADER.unpack_from(data)
+        if magic != BINARY_MAGIC:
+            raise ValueError("Not a binary matrix file: missing SPMX header")
+        if rows <= 0 or cols <= 0:
+            raise ValueError(f"Invalid dimensions: {rows}x{cols} (must be positive)")
+        if len(data) != _BINARY_HEADER.size + 8 * (rows + 1 + 2 * nnz):
+            raise ValueError(
+                f"Binary matrix file has wrong size for a {rows}x{cols} matrix "
+                f"with {nnz} elements"
+            )
+            
+        arrays = []
+        offset = _BINARY_HEADER.size
+        for count in (rows + 1, nnz, nnz):
+            values = array('q')
+            values.frombytes(data[offset:offset + 8 * count])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            arrays.append(values)
+            offset += 8 * count
+        indptr, indices, values = arrays
+        
+        if indptr[0] != 0 or indptr[rows] != nnz or any(
+                map(gt, indptr, islice(indptr, 1, None))):
+            raise ValueError("Binary matrix file has invalid row offsets")
+        if nnz and (min(indices) < 0 or max(indices) >= cols):
+            raise ValueError("Binary matrix file has out-of-bounds column indices")
+            
+        # Columns must strictly increase within each row, so every place where
+        # they don't must be the start of a row
+        for position in compress(range(1, nnz), map(le, islice(indices, 1, None), indices)):
+            if indptr[bisect_left(indptr, position)] != position:
+                raise ValueError(
+                    "Binary matrix file has unsorted or duplicate column indices"
+                )
+        if 0 in values:
+            raise ValueError("Binary matrix file stores zero values")
+            
+        return rows, cols, (indptr, array(_index_typecode(cols), indices), values)
+
     def get_density(self) -> float:
         """
         Calculate the density of the matrix (proportion of non-zero elements).
@@ -357,35 +1155,89 @@ class SparseMatrix:
         total_elements = self.rows * self.cols
         if total_elements == 0:
             return 0.0
-        return len(self.elements) / total_elements
+        return self.nnz / total_elements
 
     def get_statistics(self) -> dict:
         """
         Get statistical information about the matrix.
         
+        The statistics are computed once and reused until the matrix is modified.
+        
+        Returns:
+            dict: Dictionary containing matrix statistics
+        """
+        if self._stats is None:
+            self._stats = self._compute_statistics()
+        return dict(self._stats)
+
+    def _compute_statistics(self) -> dict:
+        """
+        Compute the statistics returned by get_statistics.
+        
         Returns:
             dict: Dictionary containing matrix statistics
         """
-        if not self.elements:
+        nnz = self.nnz
+        total_elements = self.rows * self.cols
+        if nnz == 0:
             return {
                 "dimensions": (self.rows, self.cols),
                 "non_zero_elements": 0,
                 "density": 0.0,
                 "min_value": None,
                 "max_value": None,
-                "total_elements": self.rows * self.cols
+                "total_elements": total_elements
             }
         
-        values = list(self.elements.values())
+        # One fused pass finds both extremes without copying the values
+        if self._elements is None:
+            values = iter(self._csr[2])
+        else:
+            values = iter(self._elements.values())
+        min_value = max_value = next(values)
+        for value in values:
+            if value < min_value:
+                min_value = value
+            elif value > max_value:
+                max_value = value
+        
         return {
             "dimensions": (self.rows, self.cols),
-            "non_zero_elements": len(self.elements),
-            "density": self.get_density(),
-            "min_value": min(values),
-            "max_value": max(values),
-            "total_elements": self.rows * self.cols
+            "non_zero_elements": nnz,
+            "density": nnz / total_elements,  # Same as get_density(), without recounting
+            "min_value": min_value,
+            "max_value": max_value,
+            "total_elements": total_elements
         }
 
+    def __getstate__(self) -> dict:
+        """
+        Get the state to pickle, leaving out the cached CSR arrays and statistics.
+        
+        Matrices are pickled when sent to worker processes; the caches can be
+        rebuilt there on demand, so they are not worth copying. Matrices that
+        have no element dictionary yet are pickled as their CSR arrays instead.
+        
+        Returns:
+            dict: Dimensions and elements (or CSR arrays) of the matrix
+        """
+        if self._elements is None:
+            return {"rows": self.rows, "cols": self.cols, "csr": self._csr}
+        return {"rows": self.rows, "cols": self.cols, "elements": self._elements}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore a pickled matrix.
+        
+        Args:
+            state (dict): State produced by __getstate__
+        """
+        self.rows = state["rows"]
+        self.cols = state["cols"]
+        self._elements = state.get("elements")
+        self._csr = state.get("csr")
+        self._stats = None
+
     def __str__(self) -> str:
         """
         Get string representation of the matrix.
@@ -396,7 +1248,7 @@ class SparseMatrix:
         stats = self.get_statistics()
         return (
             f"SparseMatrix({self.rows}x{self.cols}) with "
-            f"{len(self.elements)} non-zero elements "
+            f"{self.nnz} non-zero elements "
             f"(density: {stats['density']:.2%})"
         )
 
@@ -409,5 +1261,5 @@ class SparseMatrix:
         """
         return (
             f"SparseMatrix(rows={self.rows}, cols={self.cols}, "
-            f"elements={dict(sorted(self.elements.items()))})"
+            f"elements={dict(sorted(self._element_dict().items()))})"
         )
\ No newline at end of file